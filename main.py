@@ -1,10 +1,59 @@
 import argparse
+import glob
+import json
 import logging
 import subprocess
-import shlex
 import time
 import os
 import platform
+import re
+import sys
+import queue
+
+try:
+    import win32evtlog  # Optional: event-driven monitoring on Windows (pywin32)
+except ImportError:
+    win32evtlog = None
+
+try:
+    import pywintypes
+    import win32com.client  # Optional: in-process Task Scheduler access on Windows (pywin32)
+except ImportError:
+    win32com = None
+
+try:
+    from inotify_simple import INotify, flags  # Optional: event-driven monitoring on Linux
+except ImportError:
+    INotify = None
+
+# Operating system, looked up once at import time
+OS_NAME = platform.system()
+
+# Cron entry prefix: five schedule fields, plus a user field in system crontabs
+CRON_RE = re.compile(r'^\s*(\S+(?:\s+\S+){4})\s+')
+SYSTEM_CRON_RE = re.compile(r'^\s*(\S+(?:\s+\S+){4})\s+\S+\s+')
+
+# File names cron loads from /etc/cron.d; others (*.dpkg-old, foo~, foo.bak...) are ignored by cron
+CRON_D_NAME_RE = re.compile(r'^[A-Za-z0-9_-]+$')
+
+# Event log channel the Task Scheduler writes task history to
+TASK_SCHEDULER_CHANNEL = "Microsoft-Windows-TaskScheduler/Operational"
+
+# Cron directories watched for changes on Linux, mapped to the entry names that
+# matter in them (None for any entry). Directories are watched rather than files
+# because editors and crontab replace files by rename, which drops a file watch.
+CRON_WATCH_DIRS = {
+    "/etc": {"crontab", "cron.d"},
+    "/etc/cron.d": None,
+    "/var/spool/cron": None,
+    "/var/spool/cron/crontabs": None,
+}
+
+# Long-lived PowerShell process shared by all checks, and the markers used to
+# delimit the output of each command sent to it
+POWERSHELL_SESSION = None
+POWERSHELL_END_MARKER = "__END__"
+POWERSHELL_ERROR_MARKER = "__ERROR__"
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -22,6 +71,265 @@ def setup_argparse():
     # parser.add_argument("-i", "--interval", dest="interval", type=int, help="Polling interval in seconds.", default=60)
     return parser.parse_args()
 
+def read_cron_file(path):
+    """
+    Reads a cron file.
+
+    Args:
+        path: Path to the cron file.
+
+    Returns:
+        The lines of the file, or an empty list if it does not exist.
+    """
+    try:
+        with open(path) as f:
+            return f.read().splitlines()
+    except FileNotFoundError:
+        return []
+
+def parse_cron_lines(lines, has_user_field=False):
+    """
+    Parses crontab lines into task dictionaries.
+
+    Args:
+        lines: The lines of a crontab.
+        has_user_field: Whether entries have a user field after the schedule,
+            as in /etc/crontab and /etc/cron.d.
+
+    Returns:
+        A list of dictionaries with task name, trigger time and command.
+    """
+    pattern = SYSTEM_CRON_RE if has_user_field else CRON_RE
+    tasks = []
+    for line in lines:
+        if line.strip() and not line.startswith("#"): # Ignore comments and empty lines
+            m = pattern.match(line)
+            if not m:
+                continue
+            trigger_time = m.group(1)
+            command = sys.intern(line[m.end():].strip())  # Repeats every check, share one copy
+            if command:
+                tasks.append({
+                    "task_name": command,  # Using command as task name for simplicity
+                    "trigger_time": trigger_time,
+                    "command": command
+                })
+    return tasks
+
+def get_powershell_session():
+    """
+    Returns the long-lived PowerShell process, starting it if needed.
+    Reusing one process avoids paying PowerShell startup cost on every check.
+
+    Returns:
+        A subprocess.Popen reading commands from its stdin.
+    """
+    global POWERSHELL_SESSION
+    if POWERSHELL_SESSION is None or POWERSHELL_SESSION.poll() is not None:
+        POWERSHELL_SESSION = subprocess.Popen(
+            ["powershell", "-NoProfile", "-NonInteractive", "-Command", "-"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1
+        )
+    return POWERSHELL_SESSION
+
+def close_powershell_session():
+    """
+    Shuts down the long-lived PowerShell process, if one is running.
+    """
+    global POWERSHELL_SESSION
+    if POWERSHELL_SESSION is None:
+        return
+    try:
+        POWERSHELL_SESSION.stdin.close()
+        POWERSHELL_SESSION.wait(timeout=5)
+    except (OSError, subprocess.TimeoutExpired):
+        POWERSHELL_SESSION.kill()
+    POWERSHELL_SESSION = None
+
+def query_windows_tasks(selector):
+    """
+    Runs a Get-ScheduledTask query in the PowerShell session and parses its output.
+
+    Args:
+        selector: The PowerShell expression producing the tasks, e.g. "Get-ScheduledTask".
+
+    Returns:
+        A list of raw task records, or None if an error occurs.
+    """
+    fields = (
+        "TaskName,TaskPath,State,"
+        "@{N='LastRunTime';E={(Get-ScheduledTaskInfo $_).LastRunTime}},"
+        "@{N='Actions';E={($_.Actions|%{$_.Execute+' '+$_.Arguments}) -join ';'}}"
+    )
+    # One compact JSON object per line lets us parse tasks as they arrive
+    # rather than buffering the whole inventory. Errors are reported in-band,
+    # flattened onto the marker line, and the end marker tells us where this
+    # command's output stops.
+    script = (
+        f"try {{ $ErrorActionPreference = 'Stop'; "
+        f"{selector} | Select-Object {fields} | ForEach-Object {{ $_ | ConvertTo-Json -Compress -Depth 3 }} "
+        f"}} catch {{ Write-Output ('{POWERSHELL_ERROR_MARKER}' + (($_ | Out-String) -replace '\\r?\\n', ' ').Trim()) }}; "
+        f"Write-Output '{POWERSHELL_END_MARKER}'\n"
+    )
+
+    session = get_powershell_session()
+    records = []
+    error = None
+    try:
+        session.stdin.write(script)
+        session.stdin.flush()
+        for line in session.stdout:
+            line = line.strip()
+            if line == POWERSHELL_END_MARKER:
+                break
+            if line.startswith(POWERSHELL_ERROR_MARKER):
+                error = line[len(POWERSHELL_ERROR_MARKER):]
+            elif line:
+                record = json.loads(line)
+                # Names and paths repeat every check, intern them to share one copy
+                record["TaskName"] = sys.intern(record["TaskName"])
+                if record.get("TaskPath"):
+                    record["TaskPath"] = sys.intern(record["TaskPath"])
+                records.append(record)
+        else:
+            close_powershell_session()
+            logging.error("PowerShell session exited unexpectedly.")
+            return None
+    except Exception:
+        # The session's output is now out of sync, start a fresh one next time
+        close_powershell_session()
+        raise
+
+    if error:
+        logging.error(f"Error retrieving scheduled tasks: {error}")
+        return None
+    return records
+
+def get_windows_scheduled_tasks():
+    """
+    Retrieves the list of scheduled tasks from the Windows Task Scheduler.
+
+    Returns:
+        A list of task dictionaries, or None if an error occurs.
+    """
+    # Single PowerShell invocation that emits every field for every task
+    records = query_windows_tasks("Get-ScheduledTask")
+    if records is None:
+        return None
+
+    tasks = [{
+        "task_name": r["TaskName"],
+        "last_run_time": r.get("LastRunTime"),
+        "task_path": r.get("TaskPath"),
+        "state": r.get("State"),
+        "actions": r.get("Actions")
+    } for r in records]
+    return tasks
+
+def get_windows_scheduled_tasks_com():
+    """
+    Retrieves the list of scheduled tasks through the Task Scheduler COM interface.
+    This avoids starting PowerShell entirely. Folders and tasks that cannot be read
+    (e.g. access denied for a non-elevated user) are skipped, as Get-ScheduledTask does.
+
+    Returns:
+        A list of task dictionaries, or None if an error occurs. Falls back to the
+        PowerShell collector if the Task Scheduler service cannot be reached.
+    """
+    try:
+        scheduler = win32com.client.Dispatch("Schedule.Service")
+        scheduler.Connect()
+        folders = [scheduler.GetFolder("\\")]
+    except pywintypes.com_error as e:
+        logging.warning(f"Could not connect to the Task Scheduler service, falling back to PowerShell: {e}")
+        return get_windows_scheduled_tasks()
+
+    tasks = []
+    while folders:
+        folder = folders.pop()
+        try:
+            folders.extend(folder.GetFolders(0))
+            folder_tasks = folder.GetTasks(1)  # TASK_ENUM_HIDDEN
+            # Same format as the TaskPath reported by Get-ScheduledTask
+            task_path = sys.intern(folder.Path.rstrip("\\") + "\\")
+        except pywintypes.com_error as e:
+            logging.debug(f"Skipping unreadable task folder: {e}")
+            continue
+
+        for task in folder_tasks:
+            try:
+                actions = ";".join(
+                    f"{action.Path} {action.Arguments}"
+                    for action in task.Definition.Actions
+                    if action.Type == 0  # TASK_ACTION_EXEC
+                )
+                tasks.append({
+                    "task_name": sys.intern(task.Name),
+                    "last_run_time": str(task.LastRunTime),
+                    "task_path": task_path,
+                    "state": task.State,
+                    "actions": actions
+                })
+            except pywintypes.com_error as e:
+                logging.debug(f"Skipping unreadable task in {task_path}: {e}")
+    return tasks
+
+def get_user_spool_paths():
+    """
+    Returns the possible spool locations of the current user's crontab.
+
+    Returns:
+        The Debian-style and Red Hat-style spool paths.
+    """
+    import pwd  # Unix-only module
+    user = pwd.getpwuid(os.getuid()).pw_name
+    return (f"/var/spool/cron/crontabs/{user}", f"/var/spool/cron/{user}")
+
+def get_linux_cron_tasks():
+    """
+    Retrieves the list of cron tasks for the current user and the system crontabs.
+    (Example for Linux using cron, might need adaptation based on the actual scheduler.)
+
+    Returns:
+        A list of task dictionaries, or None if an error occurs.
+    """
+    try:
+        user_lines = []
+        for path in get_user_spool_paths():
+            user_lines += read_cron_file(path)
+    except PermissionError:
+        # The spool is usually not readable by unprivileged users, ask crontab instead
+        try:
+            process = subprocess.run(["crontab", "-l"], capture_output=True, text=True, check=False)
+        except FileNotFoundError:
+            logging.error("crontab command not found. Make sure it is installed and in your PATH.")
+            return None
+        if process.returncode == 1 and "no crontab" in process.stderr:
+            user_lines = []  # Same as a missing spool file
+        elif process.returncode != 0:
+            logging.error(f"Error retrieving cron tasks: {process.stderr}")
+            return None
+        else:
+            user_lines = process.stdout.splitlines()
+
+    # System crontabs carry an extra user field before the command
+    system_lines = read_cron_file("/etc/crontab")
+    for path in sorted(glob.glob("/etc/cron.d/*")):
+        if not CRON_D_NAME_RE.match(os.path.basename(path)) or not os.path.isfile(path):
+            continue
+        try:
+            system_lines += read_cron_file(path)
+        except OSError as e:
+            logging.debug(f"Skipping unreadable cron file: {path}: {e}")
+
+    return parse_cron_lines(user_lines) + parse_cron_lines(system_lines, has_user_field=True)
+
+# Platform specific collector, resolved once since the OS cannot change at runtime
+TASK_COLLECTOR = {
+    'Windows': get_windows_scheduled_tasks_com if win32com is not None else get_windows_scheduled_tasks,
+    'Linux': get_linux_cron_tasks,
+}.get(OS_NAME)
+
 def get_scheduled_tasks():
     """
     Retrieves the list of scheduled tasks from the system.
@@ -31,89 +339,227 @@ def get_scheduled_tasks():
         and contains task name, trigger time, and command.
         Returns None if an error occurs.
     """
-    try:
-        # Platform specific command to get scheduled tasks
-        if platform.system() == 'Windows':
-            command = "powershell Get-ScheduledTask | Select-Object TaskName, LastRunTime, TaskPath, State, Actions"
-            process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            stdout, stderr = process.communicate()
-            if stderr:
-                logging.error(f"Error retrieving scheduled tasks: {stderr}")
-                return None
-
-            tasks = []
-            for line in stdout.splitlines():
-                if line.startswith("TaskName"):
-                    continue # Skip header line
-                if line.strip(): #Handle empty lines
-                    parts = line.split(maxsplit=1)
-                    if len(parts) >= 1:
-                        task_name = parts[0].strip()
-
-                        command_taskpath = "powershell Get-ScheduledTask -TaskName \"{}\" | Select-Object TaskName, LastRunTime, TaskPath, State, Actions".format(task_name)
-                        process_taskpath = subprocess.Popen(command_taskpath, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-                        stdout_taskpath, stderr_taskpath = process_taskpath.communicate()
-
-                        if stderr_taskpath:
-                            logging.error(f"Error retrieving task path for {task_name}: {stderr_taskpath}")
-                            continue
-
-                        last_run_time = None
-                        task_path = None
-                        state = None
-                        actions = None
-
-                        for taskline in stdout_taskpath.splitlines():
-                             if "LastRunTime" in taskline:
-                                 last_run_time = taskline.split(":",1)[1].strip()
-                             if "TaskPath" in taskline:
-                                 task_path = taskline.split(":",1)[1].strip()
-                             if "State" in taskline:
-                                  state = taskline.split(":", 1)[1].strip()
-                             if "Actions" in taskline:
-                                  actions = taskline.split(":", 1)[1].strip()
-
-                        tasks.append({
-                            "task_name": task_name,
-                            "last_run_time": last_run_time,
-                            "task_path": task_path,
-                            "state": state,
-                            "actions": actions
-                        })
-            return tasks
-
-        elif platform.system() == 'Linux': # Example for Linux using cron (might need adaptation based on the actual scheduler)
-            command = "crontab -l"
-            process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            stdout, stderr = process.communicate()
-            if stderr:
-                logging.error(f"Error retrieving cron tasks: {stderr}")
-                return None
-
-            tasks = []
-            for line in stdout.splitlines():
-                if line.strip() and not line.startswith("#"): # Ignore comments and empty lines
-                    parts = line.split()
-                    if len(parts) > 5:
-                        trigger_time = " ".join(parts[:5])
-                        command = " ".join(parts[5:])
-                        tasks.append({
-                            "task_name": command,  # Using command as task name for simplicity
-                            "trigger_time": trigger_time,
-                            "command": command
-                        })
-            return tasks
-        else:
-            logging.error(f"Unsupported operating system: {platform.system()}")
-            return None
+    if TASK_COLLECTOR is None:
+        logging.error(f"Unsupported operating system: {OS_NAME}")
+        return None
 
-    except FileNotFoundError:
-        logging.error("crontab command not found. Make sure it is installed and in your PATH.")
+    try:
+        return TASK_COLLECTOR()
+    except FileNotFoundError as e:
+        logging.error(f"Command not found: {e.filename}. Make sure it is installed and in your PATH.")
         return None
     except Exception as e:
         logging.error(f"An unexpected error occurred: {e}")
         return None
 
+def get_tasks_signature(tasks):
+    """
+    Computes a cheap content signature for a task snapshot.
+
+    Args:
+        tasks: A list of task dictionaries as returned by get_scheduled_tasks().
+
+    Returns:
+        A hash that is equal for snapshots with identical task names, trigger times,
+        commands and states.
+    """
+    return hash(tuple(sorted(
+        (task['task_name'], task.get('trigger_time'), task.get('command'), task.get('state'))
+        for task in tasks
+    )))
+
+def get_task_digest(task):
+    """
+    Extracts the fields of a task that are compared between checks.
+
+    Args:
+        task: A task dictionary as returned by get_scheduled_tasks().
+
+    Returns:
+        A (trigger_time, command, state) tuple.
+    """
+    return (task.get('trigger_time'), task.get('command'), task.get('state'))
+
+def is_task_history_enabled():
+    """
+    Checks whether the Task Scheduler event channel is enabled. It is disabled
+    by default on most installs, in which case subscribing succeeds but no
+    events are ever delivered.
+
+    Returns:
+        True if the channel is enabled, False otherwise.
+    """
+    try:
+        config = win32evtlog.EvtOpenChannelConfig(TASK_SCHEDULER_CHANNEL)
+        enabled, _ = win32evtlog.EvtGetChannelConfigProperty(config, win32evtlog.EvtChannelConfigEnabled)
+    except Exception as e:
+        logging.warning(f"Could not read Task Scheduler event channel configuration, falling back to polling: {e}")
+        return False
+    if not enabled:
+        logging.warning(f"Task Scheduler history ({TASK_SCHEDULER_CHANNEL}) is disabled, falling back to polling.")
+    return bool(enabled)
+
+def value_or_na(value):
+    """
+    Formats a task field for logging.
+
+    Args:
+        value: The field value, or None if the task has no such field.
+
+    Returns:
+        The value itself, or 'N/A' if it is None.
+    """
+    return 'N/A' if value is None else value
+
+def create_change_waiter(interval=60, heartbeat=3600):
+    """
+    Creates a function that blocks until scheduled tasks may have changed.
+
+    On Windows with pywin32 installed and task history enabled, this waits for
+    Task Scheduler events (task registered, updated, deleted or disabled) instead
+    of polling. Other state changes, such as a task being re-enabled or starting
+    to run, raise no such event and are only seen on the heartbeat. On Linux with
+    inotify_simple installed, it watches the cron directories; if some collected
+    path cannot be watched it still rescans at least once per polling interval.
+    Otherwise it falls back to sleeping for the polling interval.
+
+    Args:
+        interval: Polling interval in seconds, used when no event source is available.
+        heartbeat: Maximum time in seconds to wait for an event before rescanning anyway.
+
+    Returns:
+        A callable that blocks until the next check should run.
+    """
+    if OS_NAME == 'Windows' and win32evtlog is not None and is_task_history_enabled():
+        events = queue.Queue()
+
+        def on_event(action, context, event):
+            events.put(action)
+
+        try:
+            subscription = win32evtlog.EvtSubscribe(
+                TASK_SCHEDULER_CHANNEL,
+                win32evtlog.EvtSubscribeToFutureEvents,
+                None,
+                Callback=on_event,
+                Query="*[System[(EventID=106 or EventID=140 or EventID=141 or EventID=142)]]"
+            )
+        except Exception as e:
+            logging.warning(f"Could not subscribe to Task Scheduler events, falling back to polling: {e}")
+        else:
+            def wait_for_event():
+                try:
+                    events.get(timeout=heartbeat)
+                except queue.Empty:
+                    return  # Heartbeat elapsed, rescan anyway
+                # Coalesce a burst of events into a single rescan
+                while not events.empty():
+                    events.get_nowait()
+
+            wait_for_event.subscription = subscription  # Keep the subscription handle alive
+            return wait_for_event
+
+    elif OS_NAME == 'Linux' and INotify is not None:
+        inotify = INotify()
+        watch_flags = (flags.MODIFY | flags.CREATE | flags.DELETE | flags.MOVED_TO | flags.MOVED_FROM
+                       | flags.CLOSE_WRITE | flags.DELETE_SELF | flags.MOVE_SELF)
+        watches = {}  # Watch descriptor -> directory
+
+        def arm_watches():
+            """Watches the cron directories not yet watched; returns whether every collected path is covered."""
+            complete = True
+            watched = set(watches.values())
+            for directory in CRON_WATCH_DIRS:
+                if directory in watched:
+                    continue
+                try:
+                    watches[inotify.add_watch(directory, watch_flags)] = directory
+                except FileNotFoundError:
+                    pass  # Nothing to collect yet; the parent's watch sees it being created
+                except OSError as e:
+                    # Typically EACCES on the cron spool for unprivileged users
+                    logging.debug(f"Not watching {directory}: {e}")
+                    complete = False
+            # An unreadable spool file means the collector falls back to crontab -l
+            for path in get_user_spool_paths():
+                if os.path.exists(path) and not os.access(path, os.R_OK):
+                    complete = False
+            return complete
+
+        complete = arm_watches()
+        if watches:
+            last_wake = time.monotonic()
+
+            def wait_for_inotify():
+                nonlocal complete, last_wake
+                # When every collected path is watched, only the heartbeat bounds the wait.
+                # Otherwise rescan at least once per polling interval so changes in the
+                # unwatched paths are still seen in time.
+                # The deadline is measured from the previous wake, not from now, so the
+                # time spent collecting tasks does not stretch the period.
+                deadline = last_wake + (heartbeat if complete else interval)
+                if deadline <= time.monotonic():
+                    logging.warning("Monitor overrun by %.1fs", time.monotonic() - deadline)
+                    last_wake = time.monotonic()
+                    return
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        last_wake = deadline
+                        break
+                    # The short read delay coalesces a burst of events (e.g. an editor save) into one rescan
+                    events = inotify.read(timeout=int(remaining * 1000), read_delay=100)
+                    relevant = False
+                    for event in events:
+                        if event.mask & flags.IGNORED:
+                            watches.pop(event.wd, None)  # Directory removed or replaced, re-armed below
+                            relevant = True
+                            continue
+                        names = CRON_WATCH_DIRS.get(watches.get(event.wd))
+                        if names is None or event.name in names:
+                            relevant = True
+                    if relevant:
+                        last_wake = time.monotonic()
+                        break
+                complete = arm_watches()
+
+            return wait_for_inotify
+        inotify.close()
+        logging.warning("Could not watch any cron locations, falling back to polling.")
+
+    # Sleep until a fixed monotonic deadline so the time spent collecting tasks
+    # does not stretch the polling period
+    deadline = time.monotonic()
+
+    def wait_for_interval():
+        nonlocal deadline
+        deadline += interval
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        else:
+            logging.warning("Monitor overrun by %.1fs", -remaining)
+            deadline = time.monotonic()
+
+    return wait_for_interval
+
+def log_task_changes(changes):
+    """
+    Logs all changes found in one check as a single multi-line record, so the
+    handler is locked, formatted and flushed once per check instead of once per task.
+    Formatting stays lazy: the per-change format strings and arguments are combined
+    and only rendered if the record is emitted.
+
+    Args:
+        changes: A list of (level, format, args) tuples, one per changed task.
+    """
+    if not changes:
+        return
+    level = max(change[0] for change in changes)
+    message = "\n".join(change[1] for change in changes)
+    args = tuple(arg for change in changes for arg in change[2])
+    logging.log(level, message, *args)
+
 def monitor_scheduled_tasks():
     """
     Monitors scheduled tasks for changes and logs them.
@@ -123,45 +569,72 @@ def monitor_scheduled_tasks():
         if previous_tasks is None:
             logging.error("Failed to retrieve initial scheduled tasks. Exiting.")
             return
+        prev_sig = get_tasks_signature(previous_tasks)
+        # Only the compared fields of the previous snapshot are kept between iterations
+        prev_digests = {task['task_name']: get_task_digest(task) for task in previous_tasks}
+        del previous_tasks
+        wait_for_change = create_change_waiter()
 
         while True:
-            time.sleep(60)  # Check every 60 seconds (configurable)
+            wait_for_change()  # Event-driven where supported, otherwise every 60 seconds (configurable)
 
             current_tasks = get_scheduled_tasks()
             if current_tasks is None:
                 logging.error("Failed to retrieve current scheduled tasks. Skipping this iteration.")
                 continue
 
-            # Compare tasks
-            previous_task_names = {task['task_name'] for task in previous_tasks}
-            current_task_names = {task['task_name'] for task in current_tasks}
+            # Nothing changed since the last check, skip the diff entirely
+            sig = get_tasks_signature(current_tasks)
+            if sig == prev_sig:
+                continue
 
-            added_tasks = current_task_names - previous_task_names
-            removed_tasks = previous_task_names - current_task_names
+            # Compare tasks, indexed by name for O(1) lookups
+            curr_by_name = {task['task_name']: task for task in current_tasks}
+            curr_digests = {name: get_task_digest(task) for name, task in curr_by_name.items()}
 
-            for task_name in added_tasks:
-                task = next(task for task in current_tasks if task['task_name'] == task_name)
+            added_tasks = curr_digests.keys() - prev_digests.keys()
+            removed_tasks = prev_digests.keys() - curr_digests.keys()
 
-                log_message = f"New scheduled task added: Name: {task['task_name']}, Trigger Time: {task.get('trigger_time', 'N/A')}, Command: {task.get('command', 'N/A')}, LastRunTime: {task.get('last_run_time', 'N/A')}, TaskPath: {task.get('task_path', 'N/A')}, State: {task.get('state', 'N/A')}, Actions: {task.get('actions', 'N/A')}"
-                logging.info(log_message)
+            changes = []
+            for task_name in added_tasks:
+                task = curr_by_name[task_name]
+                changes.append((
+                    logging.INFO,
+                    "New scheduled task added: Name: %s, Trigger Time: %s, Command: %s, LastRunTime: %s, TaskPath: %s, State: %s, Actions: %s",
+                    (task['task_name'], task.get('trigger_time', 'N/A'), task.get('command', 'N/A'), task.get('last_run_time', 'N/A'),
+                     task.get('task_path', 'N/A'), task.get('state', 'N/A'), task.get('actions', 'N/A'))
+                ))
 
             for task_name in removed_tasks:
-                log_message = f"Scheduled task removed: Name: {task_name}"
-                logging.warning(log_message)
+                changes.append((logging.WARNING, "Scheduled task removed: Name: %s", (task_name,)))
+
+            # Tasks present in both snapshots whose compared fields differ; added
+            # tasks fall back to their own digest and are never included
+            updated_tasks = [name for name, digest in curr_digests.items() if prev_digests.get(name, digest) != digest]
 
-            for current_task in current_tasks:
-                previous_task = next((task for task in previous_tasks if task['task_name'] == current_task['task_name']), None)
-                if previous_task:
-                  if current_task.get('trigger_time') != previous_task.get('trigger_time') or current_task.get('command') != previous_task.get('command'):
+            for task_name in updated_tasks:
+                current_task = curr_by_name[task_name]
+                # Old and new compared fields are rendered the same way, so falsy values
+                # such as state 0 (TASK_STATE_UNKNOWN) show on both sides
+                new_trigger_time, new_command, new_state = (value_or_na(v) for v in curr_digests[task_name])
+                old_trigger_time, old_command, old_state = (value_or_na(v) for v in prev_digests[task_name])
+                changes.append((
+                    logging.INFO,
+                    "Scheduled task updated: Name: %s, New Trigger Time: %s, New Command: %s, Old Trigger Time: %s, Old Command: %s, LastRunTime: %s, TaskPath: %s, State: %s, Old State: %s, Actions: %s",
+                    (task_name, new_trigger_time, new_command, old_trigger_time, old_command, current_task.get('last_run_time', 'N/A'),
+                     current_task.get('task_path', 'N/A'), new_state, old_state, current_task.get('actions', 'N/A'))
+                ))
 
-                     log_message = f"Scheduled task updated: Name: {current_task['task_name']}, New Trigger Time: {current_task.get('trigger_time', 'N/A')}, New Command: {current_task.get('command', 'N/A')}, Old Trigger Time: {previous_task.get('trigger_time', 'N/A')}, Old Command: {previous_task.get('command', 'N/A')}, LastRunTime: {current_task.get('last_run_time', 'N/A')}, TaskPath: {current_task.get('task_path', 'N/A')}, State: {current_task.get('state', 'N/A')}, Actions: {current_task.get('actions', 'N/A')}"
-                     logging.info(log_message)
-            previous_tasks = current_tasks
+            log_task_changes(changes)
+            prev_sig = sig
+            prev_digests = curr_digests
 
     except KeyboardInterrupt:
         logging.info("Monitoring stopped by user.")
     except Exception as e:
         logging.error(f"An unexpected error occurred: {e}")
+    finally:
+        close_powershell_session()
 
 def main():
     """